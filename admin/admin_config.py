@@ -12,7 +12,7 @@ from core.exception import AlertException
 from core.formclass import ConfigForm
 from core.models import Config
 from core.template import AdminTemplates
-from lib.common import get_client_ip, get_host_public_ip
+from lib.common import clear_config_cache, get_client_ip, get_host_public_ip
 from lib.dependency.dependencies import validate_super_admin, validate_token
 from lib.template_functions import (
     get_editor_select, get_member_level_select, get_skin_select,
@@ -94,5 +94,6 @@ async def config_form_update(
     for field, value in form_data.__dict__.items():
         setattr(config, field, value)
     db.commit()
+    clear_config_cache()
 
     return RedirectResponse("/admin/config_form", status_code=303)
@@ -14,6 +14,7 @@ from core.template import (
     AdminTemplates, TEMPLATES, TemplateService, UserTemplates,
     get_current_theme, get_theme_list, get_theme_info, register_theme_statics,
 )
+from lib.common import clear_config_cache
 from lib.dependency.dependencies import validate_super_admin, validate_theme
 
 logging.basicConfig(level=logging.INFO)
@@ -41,6 +42,7 @@ async def theme(request: Request, db: db_session):
     if current_theme not in theme_list:
         config.cf_theme = current_theme = "basic"
         db.commit()
+        clear_config_cache()
 
     # 현재 사용 중인 테마를 목록 맨 앞으로 이동
     if current_theme and current_theme in theme_list:
@@ -101,6 +103,7 @@ async def theme_update(
     db.commit()
 
     # 선택한 테마로 캐시&설정 데이터들을 갱신합니다.
+    clear_config_cache()
     get_current_theme.cache_clear()
     TemplateService.set_templates_dir()
     cache_directory = "data/cache"
@@ -1,4 +1,6 @@
 """API environment configuration file"""
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -32,4 +34,14 @@ class ApiSettings(BaseSettings):
     REFRESH_TOKEN_SECRET_KEY: str = "refresh_token_secret_key"
 
 
-api_settings = ApiSettings()
+@lru_cache(maxsize=1)
+def get_api_settings() -> ApiSettings:
+    """Return the ApiSettings instance shared across the application.
+
+    - The .env file is parsed only once per process.
+    - The module-level `api_settings` is this same instance.
+    """
+    return ApiSettings()
+
+
+api_settings = get_api_settings()
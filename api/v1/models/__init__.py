@@ -22,6 +22,9 @@ class MemberRefreshToken(Base):
     created_at = Column(DateTime, default=datetime.now)
     updated_at = Column(DateTime, default=datetime.now)
 
+# 접두사를 제외한 테이블 이름 (core.models.set_table_prefix 에서 사용)
+MemberRefreshToken.__table__.info["base_name"] = "member_refresh_token"
+
 # MemberRefreshToken 테이블 생성
 # TODO: 
 #   1. 테이블이 생성되는 시점에 대해 고민이 필요함
@@ -1,4 +1,4 @@
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Mapping, Optional
 
 from fastapi import Depends
 from sqlalchemy import create_engine
@@ -74,15 +74,21 @@ class DBSetting:
     def table_prefix(self, prefix: str) -> None:
         self._table_prefix = prefix
 
-    def set_connect_infomation(self) -> None:
-        self._table_prefix = settings.DB_TABLE_PREFIX
-        self._db_engine = settings.DB_ENGINE
-        self._user = settings.DB_USER
-        self._password = settings.DB_PASSWORD
-        self._host = settings.DB_HOST
-        self._port = settings.DB_PORT
-        self._db_name = settings.DB_NAME
-        self._charset = settings.DB_CHARSET
+    def set_connect_infomation(self, connect_info: Optional[Mapping[str, Any]] = None) -> None:
+        """
+        데이터베이스 연결 정보를 설정합니다.
+        - connect_info 가 없으면 .env 설정(settings)을 사용합니다.
+        """
+        if connect_info is None:
+            connect_info = settings.model_dump()
+        self._table_prefix = connect_info["DB_TABLE_PREFIX"]
+        self._db_engine = connect_info["DB_ENGINE"]
+        self._user = connect_info["DB_USER"]
+        self._password = connect_info["DB_PASSWORD"]
+        self._host = connect_info["DB_HOST"]
+        self._port = connect_info["DB_PORT"]
+        self._db_name = connect_info["DB_NAME"]
+        self._charset = connect_info["DB_CHARSET"]
 
     def create_url(self) -> None:
         url = None
@@ -173,7 +179,7 @@ db_connect.create_engine()
 
 # 데이터베이스 세션을 가져오는 의존성 함수
 async def get_db() -> AsyncGenerator[Session, None]:
-    db = DBConnect().sessionLocal()
+    db = db_connect.sessionLocal()
     try:
         yield db
     finally:
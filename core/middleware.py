@@ -7,12 +7,18 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 
 from core.plugin import (
-    register_plugin_admin_menu, get_plugin_state_change_time,
+    get_plugin_admin_menu, get_plugin_state_change_time,
     read_plugin_state, cache_plugin_state, cache_plugin_menu, register_plugin,
     unregister_plugin, delete_router_by_tagname
 )
 from core.settings import settings, cors_config
 
+# 미들웨어를 실행하지 않는 정적 파일 확장자
+STATIC_FILE_EXTENSIONS = (
+    '.css', '.js', '.map', '.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.ico',
+    '.woff', '.woff2', '.ttf', '.eot'
+)
+
 
 def regist_core_middleware(app: FastAPI) -> None:
     """애플리케이션에 아래 미들웨어를 추가합니다.
@@ -39,7 +45,8 @@ def regist_core_middleware(app: FastAPI) -> None:
                 if not plugin.is_enable:
                     delete_router_by_tagname(app, plugin.module_name)
 
-            cache_plugin_menu.__setitem__('admin_menus', register_plugin_admin_menu(new_plugin_state))
+            cache_plugin_menu.__setitem__('admin_menus',
+                                          get_plugin_admin_menu(new_plugin_state, plugin_state_change_time))
             cache_plugin_state.__setitem__('change_time', plugin_state_change_time)
             cache_plugin_state.__setitem__('info', new_plugin_state)
 
@@ -92,7 +99,7 @@ async def should_run_middleware(request: Request) -> bool:
 
     아래 요청에 대해서는 미들웨어를 실행하지 않습니다.
     - 토큰을 생성하는 요청
-    - 정적 파일 요청 (css, js, 이미지 등)
+    - 정적 파일 요청 (css, js, 이미지, 폰트, 파비콘 등)
 
     Args:
         request (Request): FastAPI의 Request 객체
@@ -106,7 +113,8 @@ async def should_run_middleware(request: Request) -> bool:
             or path.startswith('/static')
             or path.startswith('/theme_static')
             or path.startswith('/data')
-            or path.endswith(('.css', '.js', '.jpg', 'jpeg', '.png', '.gif', '.webp'))):
+            or path.startswith('/favicon')
+            or path.endswith(STATIC_FILE_EXTENSIONS)):
         return False
 
     return True
@@ -16,6 +16,21 @@ Base = declarative_base(cls=MySQLCharsetMixin)
 DB_TABLE_PREFIX = DBConnect().table_prefix or "g6_"
 
 
+def set_table_prefix(prefix: str) -> None:
+    """Base 메타데이터에 등록된 테이블의 접두사를 변경합니다.
+    - 테이블 생성 시 table.info["base_name"]에 기록한 접두사 없는 이름을 기준으로
+      변경하므로 여러 번 호출해도 접두사가 중복으로 붙지 않습니다.
+    - base_name이 기록되지 않은 테이블은 변경하지 않습니다.
+
+    Args:
+        prefix (str): 변경할 테이블 접두사
+    """
+    for table in Base.metadata.tables.values():
+        base_name = table.info.get("base_name")
+        if base_name is not None:
+            table.name = prefix + base_name
+
+
 class Config(Base):
     """
     환경설정 테이블
@@ -958,3 +973,9 @@ class Login(Base):
     lo_datetime = Column(DateTime, nullable=False, default=func.now())
     lo_location = Column(Text, nullable=False)
     lo_url = Column(Text, nullable=False)
+
+
+# 접두사를 제외한 테이블 이름을 기록합니다. (set_table_prefix 에서 사용)
+# - 이 모듈의 테이블은 모두 DB_TABLE_PREFIX + 이름으로 정의되어 있습니다.
+for _table in Base.metadata.tables.values():
+    _table.info["base_name"] = _table.name[len(DB_TABLE_PREFIX):]
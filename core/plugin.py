@@ -13,6 +13,9 @@ from typing import List
 PLUGIN_DIR = 'plugin'
 PLUGIN_STATE_FILE = 'plugin_states.json'
 PLUGIN_STATE_FILE_PATH = f'{PLUGIN_DIR}/{PLUGIN_STATE_FILE}'
+# 플러그인 관리자 메뉴를 재시작 후에도 재사용하기 위해 저장하는 파일
+PLUGIN_MENU_CACHE_FILE = 'plugin_admin_menus.json'
+PLUGIN_MENU_CACHE_FILE_PATH = f'{PLUGIN_DIR}/{PLUGIN_MENU_CACHE_FILE}'
 
 # 전역 캐시
 # 플러그인 관리자 메뉴를 저장하는 캐시
@@ -296,6 +299,72 @@ def register_plugin_admin_menu(plugin_states, plugin_dir=PLUGIN_DIR):
     return admin_menus
 
 
+def get_plugin_menu_cache_key(plugin_states: List[PluginState], change_time: float,
+                              plugin_dir=PLUGIN_DIR) -> dict:
+    """저장된 관리자 메뉴의 유효성 확인에 사용할 키를 반환한다.
+    - 플러그인 상태 변경 시간과 활성화된 플러그인의 메뉴를 만드는 파일들의 변경 시간으로 구성한다.
+      (plugin_config.py, register_admin_menu() 가 있는 admin 모듈)
+    Args:
+        plugin_states (list): 플러그인 상태 목록
+        change_time (float): 플러그인 상태 변경 시간
+        plugin_dir (str): 플러그인 폴더
+    Returns:
+        dict: 캐시 키
+    """
+    def get_mtime(path):
+        return os.path.getmtime(path) if path and os.path.isfile(path) else 0
+
+    file_times = {}
+    for plugin in plugin_states:
+        if plugin.is_enable:
+            config_path = os.path.join(plugin_dir, plugin.module_name, 'plugin_config.py')
+            # register_plugin() 에서 이미 import 되었으므로 sys.modules 에서 가져온다.
+            admin_module = importlib.import_module(f"{plugin_dir}.{plugin.module_name}.admin")
+            file_times[plugin.module_name] = [
+                get_mtime(config_path),
+                get_mtime(getattr(admin_module, '__file__', None)),
+            ]
+    return {"change_time": change_time, "file_times": file_times}
+
+
+def get_plugin_admin_menu(plugin_states: List[PluginState], change_time: float,
+                          plugin_dir=PLUGIN_DIR) -> list:
+    """플러그인 관리자 메뉴를 반환한다.
+    - 저장된 메뉴의 키가 현재 상태와 같으면 저장된 메뉴를 재사용한다.
+    - 다르면 register_plugin_admin_menu() 로 메뉴를 다시 만들어 저장한다.
+    Args:
+        plugin_states (list): 플러그인 상태 목록
+        change_time (float): 플러그인 상태 변경 시간
+        plugin_dir (str): 플러그인 폴더
+    Returns:
+        list: admin_menus 관리자 메뉴 목록
+    """
+    cache_key = get_plugin_menu_cache_key(plugin_states, change_time, plugin_dir)
+
+    if os.path.isfile(PLUGIN_MENU_CACHE_FILE_PATH):
+        try:
+            with open(PLUGIN_MENU_CACHE_FILE_PATH, 'r', encoding="UTF-8") as file:
+                menu_cache = json.load(file)
+            if menu_cache.get("key") == cache_key:
+                return menu_cache["menus"]
+        except Exception as e:
+            logging.warning(f"get_plugin_admin_menu: {e}")
+
+    admin_menus = register_plugin_admin_menu(plugin_states, plugin_dir)
+    # 여러 워커가 동시에 기록할 수 있으므로 프로세스별 임시 파일에 기록한 뒤 교체한다.
+    temp_path = f"{PLUGIN_MENU_CACHE_FILE_PATH}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, 'w', encoding="UTF-8") as file:
+            json.dump({"key": cache_key, "menus": admin_menus}, file, ensure_ascii=False)
+        os.replace(temp_path, PLUGIN_MENU_CACHE_FILE_PATH)
+    except (OSError, TypeError) as e:
+        logging.warning(f"get_plugin_admin_menu: {e}")
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    return admin_menus
+
+
 def register_plugin(plugin_states, plugin_dir=PLUGIN_DIR):
     """플러그인의 관리자 메뉴를 등록한다.
     Args:
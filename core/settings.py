@@ -1,4 +1,6 @@
 """Manages .env environment configuration values."""
+from functools import cached_property, lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from lib.print_log import PrintLog
 
@@ -59,11 +61,24 @@ class Settings(BaseSettings):
     CORS_ALLOW_METHODS: str = "*"
     CORS_ALLOW_HEADERS:str = "*"
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the Settings instance shared across the application.
+
+    - The .env file is parsed only once per process.
+    - The module-level `settings` is this same instance.
+    """
+    return Settings()
+
+
+settings = get_settings()
 
 
 class CORSConfig:
-    """CORS configuration"""
+    """CORS configuration
+
+    - Each value is parsed once on first access and reused afterwards.
+    """
 
     def parse_comma_separated_list(self, value):
         """Convert comma-separated string to list."""
@@ -71,12 +86,12 @@ class CORSConfig:
             return ["*"]
         return [item.strip() for item in value.split(",") if item.strip()]
 
-    @property
+    @cached_property
     def allow_origins(self):
         """CORS allowed origins"""
         return self.parse_comma_separated_list(settings.CORS_ALLOW_ORIGINS)
 
-    @property
+    @cached_property
     def allow_credentials(self):
         """CORS allow credentials"""
         allow_credentials = settings.CORS_ALLOW_CREDENTIALS
@@ -88,12 +103,12 @@ class CORSConfig:
             allow_credentials = False
         return allow_credentials
 
-    @property
+    @cached_property
     def allow_methods(self):
         """CORS allowed methods"""
         return self.parse_comma_separated_list(settings.CORS_ALLOW_METHODS)
 
-    @property
+    @cached_property
     def allow_headers(self):
         """CORS allowed headers"""
         return self.parse_comma_separated_list(settings.CORS_ALLOW_HEADERS)
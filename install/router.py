@@ -3,10 +3,10 @@ import os
 import secrets
 import shutil
 import sys
+from collections import ChainMap
 
 import fastapi
 from cachetools import TTLCache
-from dotenv import set_key
 from fastapi import APIRouter, Depends, Form, Request
 from fastapi.responses import RedirectResponse
 from fastapi.templating import Jinja2Templates
@@ -16,10 +16,10 @@ from sqlalchemy.orm import Session
 from sse_starlette.sse import EventSourceResponse
 
 from core.models import (
-    Base, Board, Config, DB_TABLE_PREFIX, Content, FaqMaster, Group, Member,
-    QaConfig
+    Base, Board, Config, Content, FaqMaster, Group, Member, QaConfig,
+    set_table_prefix
 )
-from core.database import DBConnect
+from core.database import db_connect
 from core.exception import AlertException
 from core.formclass import InstallFrom
 from core.plugin import read_plugin_state, write_plugin_state
@@ -29,7 +29,7 @@ from install.default_values import (
     default_contents, default_data_directory, default_faq_master, default_gr_id,
     default_group, default_member, default_qa_config, default_version
 )
-from lib.common import dynamic_create_write_table, read_license
+from lib.common import clear_config_cache, dynamic_create_write_table, read_license
 from lib.dependency.dependencies import validate_install, validate_token
 from lib.pbkdf2 import create_hash
 
@@ -104,42 +104,35 @@ async def install(
 ):
     """Database connection and initialization before installation starts"""
     try:
-        # Copy example.env to .env if it exists
-        if os.path.exists("example.env"):
-            shutil.copyfile("example.env", ENV_PATH)
-
-        # Add database information to .env file
-        set_key(ENV_PATH, "DB_ENGINE", form_data.db_engine)
-        set_key(ENV_PATH, "DB_HOST", form_data.db_host)
-        set_key(ENV_PATH, "DB_PORT", form_data.db_port, quote_mode="never")
-        set_key(ENV_PATH, "DB_USER", form_data.db_user)
-        set_key(ENV_PATH, "DB_PASSWORD", form_data.db_password)
-        set_key(ENV_PATH, "DB_NAME", form_data.db_name)
-        set_key(ENV_PATH, "DB_TABLE_PREFIX", form_data.db_table_prefix)
-        # Set session secret key in .env
+        # Add database information and session secret key to .env file
+        # (based on example.env if it exists)
         session_secret_key = secrets.token_urlsafe(50)
-        set_key(ENV_PATH, "SESSION_SECRET_KEY", session_secret_key)
-
-        # Apply .env file settings to Settings class
-        settings.DB_ENGINE = form_data.db_engine
-        settings.DB_HOST = form_data.db_host
-        settings.DB_PORT = form_data.db_port
-        settings.DB_USER = form_data.db_user
-        settings.DB_PASSWORD = form_data.db_password
-        settings.DB_NAME = form_data.db_name
-        settings.DB_TABLE_PREFIX = form_data.db_table_prefix
-        settings.SESSION_SECRET_KEY = session_secret_key
+        env_values = {
+            "DB_ENGINE": form_data.db_engine,
+            "DB_HOST": form_data.db_host,
+            "DB_PORT": form_data.db_port,
+            "DB_USER": form_data.db_user,
+            "DB_PASSWORD": form_data.db_password,
+            "DB_NAME": form_data.db_name,
+            "DB_TABLE_PREFIX": form_data.db_table_prefix,
+            "SESSION_SECRET_KEY": session_secret_key,
+        }
+        base_env_path = "example.env" if os.path.exists("example.env") else ENV_PATH
+        write_env_file(ENV_PATH, env_values, base_env_path)
+
+        # Overlay the installation values on the current settings
+        # without modifying the global settings object
+        installer_settings = ChainMap(env_values, settings.model_dump())
 
         # Set up database connection
-        db = DBConnect()
-        db.set_connect_infomation()
-        db.create_url()
-        if not db.supported_engines.get(form_data.db_engine.lower()):
+        db_connect.set_connect_infomation(installer_settings)
+        db_connect.create_url()
+        if not db_connect.supported_engines.get(form_data.db_engine.lower()):
             raise Exception("Please select a supported database engine.")
 
         # Create and test new database connection
-        db.create_engine()
-        connect = db.engine.connect()
+        db_connect.create_engine()
+        connect = db_connect.engine.connect()
         connect.close()
 
         # Initialize plugin activation
@@ -172,18 +165,14 @@ async def install_process():
     Installation progress event stream
     """
     async def install_event():
-        db_connect = DBConnect()
         engine = db_connect.engine
         yield "Database connection completed"
 
         try:
             form_data: InstallFrom = form_cache.get("form")
 
-            # Change table names & update metadata
-            tables = Base.metadata.tables.values()
-            for table in tables:
-                new_table_name = table.name.replace("g6_", form_data.db_table_prefix)
-                table.name = new_table_name
+            # Apply the table prefix entered in the installation form
+            set_table_prefix(form_data.db_table_prefix)
 
             if form_data.reinstall:
                 Base.metadata.drop_all(bind=engine)
@@ -192,7 +181,7 @@ async def install_process():
                 metadata.reflect(bind=engine)
                 table_names = metadata.tables.keys()
                 for name in table_names:
-                    if name.startswith(f"{DB_TABLE_PREFIX}write_"):
+                    if name.startswith(f"{form_data.db_table_prefix}write_"):
                         Table(name, metadata, autoload=True).drop(bind=engine)
 
                 yield "Existing database tables deleted"
@@ -211,10 +200,15 @@ async def install_process():
                 board_group_setup(db)
                 board_setup(db)
                 db.commit()
+                clear_config_cache()
                 yield "Default configuration data inserted"
 
-            for board in default_boards:
-                dynamic_create_write_table(board['bo_table'], create_table=True)
+            # Create all board tables at once in a single transaction
+            write_tables = [
+                dynamic_create_write_table(board['bo_table']).__table__
+                for board in default_boards
+            ]
+            Base.metadata.create_all(bind=engine, tables=write_tables, checkfirst=True)
             yield "Board tables created"
 
             setup_data_directory()
@@ -231,6 +225,45 @@ async def install_process():
     return EventSourceResponse(install_event())
 
 
+def write_env_file(env_path: str, values: dict, base_path: str = None):
+    """Write values to the .env file in a single pass
+
+    - Lines of base_path (defaults to env_path) are kept as they are,
+      except for the keys in values, which are replaced in place.
+    - Keys that are not found are appended at the end.
+    - The file is written to a temporary path and then moved into place.
+    """
+    base_path = base_path or env_path
+    lines = []
+    if os.path.exists(base_path):
+        with open(base_path, "r", encoding="utf-8") as file:
+            lines = file.readlines()
+
+    def format_line(key, value) -> str:
+        if isinstance(value, str):
+            value = value.replace("\\", "\\\\").replace("'", "\\'")
+            return f"{key}='{value}'\n"
+        return f"{key}={value}\n"
+
+    remaining = dict(values)
+    env_lines = []
+    for line in lines:
+        key = line.split("=", 1)[0].strip()
+        if "=" in line and key in remaining:
+            env_lines.append(format_line(key, remaining.pop(key)))
+        else:
+            env_lines.append(line)
+
+    if env_lines and not env_lines[-1].endswith("\n"):
+        env_lines[-1] += "\n"
+    env_lines.extend(format_line(key, value) for key, value in remaining.items())
+
+    temp_path = f"{env_path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        file.writelines(env_lines)
+    os.replace(temp_path, env_path)
+
+
 def config_setup(db: Session, admin_id, admin_email):
     """Register default configuration values"""
     exists_config = db.scalar(
@@ -272,13 +305,14 @@ def admin_member_setup(db: Session, admin_id: str, admin_name : str,
 
 def content_setup(db: Session):
     """Register default content values"""
-    for content in default_contents:
-        exists_content = db.scalar(
-            exists(Content)
-            .where(Content.co_id == content['co_id']).select()
-        )
-        if not exists_content:
-            db.execute(insert(Content).values(**content))
+    exists_co_ids = set(db.scalars(
+        select(Content.co_id)
+        .where(Content.co_id.in_([content['co_id'] for content in default_contents]))
+    ))
+    contents = [content for content in default_contents
+                if content['co_id'] not in exists_co_ids]
+    if contents:
+        db.execute(insert(Content), contents)
 
 
 def qa_setup(db: Session):
@@ -313,14 +347,14 @@ def board_group_setup(db: Session):
 
 def board_setup(db: Session):
     """Create default board values and tables"""
-    for board in default_boards:
-        exists_board = db.scalar(
-            exists(Board)
-            .where(Board.bo_table == board['bo_table']).select()
-        )
-        if not exists_board:
-            query = insert(Board).values(**board, **default_board_data)
-            db.execute(query)
+    exists_bo_tables = set(db.scalars(
+        select(Board.bo_table)
+        .where(Board.bo_table.in_([board['bo_table'] for board in default_boards]))
+    ))
+    boards = [{**board, **default_board_data} for board in default_boards
+              if board['bo_table'] not in exists_bo_tables]
+    if boards:
+        db.execute(insert(Board), boards)
 
 
 def setup_data_directory():
@@ -8,10 +8,12 @@ import random
 import re
 import shutil
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from time import sleep
 from typing import Any, List, Optional, Union
 
 import httpx
+from cachetools import LRUCache, TTLCache, cached
 from dotenv import load_dotenv
 from fastapi import Request, UploadFile
 from markupsafe import Markup, escape
@@ -20,6 +22,7 @@ from sqlalchemy import (
     Index, asc, cast, delete, desc, func, select, String, DateTime
 )
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
 from starlette.datastructures import URL
 
 from core.database import DBConnect, db_session, MySQLCharsetMixin
@@ -34,6 +37,40 @@ load_dotenv()
 CAPTCHA_PATH = "lib/captcha/templates"
 EDITOR_PATH = "lib/editor/templates"
 
+# 기본환경설정 캐시
+# 요청마다 기본환경설정 테이블을 조회하지 않도록 일정 시간 동안 캐시합니다.
+# 캐시는 워커 프로세스별로 유지됩니다.
+cache_config = TTLCache(maxsize=1, ttl=30)
+
+
+def get_cached_config(db: Session) -> Config:
+    """캐시된 기본환경설정을 반환합니다.
+    - 캐시가 없거나 만료되었을 경우에만 데이터베이스에서 조회합니다.
+
+    Args:
+        db (Session): 데이터베이스 세션
+
+    Returns:
+        Config: 기본환경설정
+    """
+    config = cache_config.get("config")
+    if config is None:
+        config = db.scalar(select(Config))
+        if config is not None:
+            # 세션이 종료된 후에도 사용할 수 있도록 세션에서 분리합니다.
+            db.expunge(config)
+            cache_config["config"] = config
+    return config
+
+
+def clear_config_cache() -> None:
+    """기본환경설정 캐시를 삭제합니다.
+    - 기본환경설정이 변경되었을 때 호출합니다.
+    - 현재 워커 프로세스의 캐시만 삭제됩니다.
+      다른 워커 프로세스는 캐시 만료 시간(TTL)이 지난 후에 갱신됩니다.
+    """
+    cache_config.clear()
+
 
 # 동적 모델 캐싱: 모델이 이미 생성되었는지 확인하고, 생성되지 않았을 경우에만 새로 생성하는 방법입니다.
 # 이를 위해 간단한 전역 딕셔너리를 사용하여 이미 생성된 모델을 추적할 수 있습니다.
@@ -68,6 +105,8 @@ def dynamic_create_write_table(
                 Index(f'idex_wr_is_comment_{table_name}', 'wr_is_comment'),
                 {
                     "extend_existing": True,
+                    # 접두사를 제외한 테이블 이름 (core.models.set_table_prefix 에서 사용)
+                    "info": {"base_name": 'write_' + table_name},
                     **MySQLCharsetMixin().__table_args__
                 },
             ),
@@ -727,21 +766,37 @@ def check_ip_list(request: Request, current_ip: str, ip_list: str, allow: bool)
     if request.state.is_super_admin:
         return allow
 
-    ip_list = ip_list.strip()
-    if not ip_list:
+    ip_regex = compile_ip_list(ip_list)
+    if ip_regex is None:
         return allow
 
-    ip_patterns = ip_list.split("\n")
-    for pattern in ip_patterns:
+    return bool(ip_regex.match(current_ip))
+
+
+@cached(LRUCache(maxsize=8))
+def compile_ip_list(ip_list: str) -> Optional[re.Pattern]:
+    """IP 목록 문자열을 하나의 정규식으로 컴파일하는 함수
+    - IP 목록 문자열 별로 캐시되므로 설정이 변경되면 새로 컴파일됩니다.
+
+    Args:
+        ip_list (str): IP 목록 문자열 (줄바꿈으로 구분, +는 와일드카드)
+
+    Returns:
+        Optional[re.Pattern]: 컴파일된 정규식, 목록이 비어있으면 None
+    """
+    patterns = []
+    for pattern in ip_list.split("\n"):
         pattern = pattern.strip()
         if not pattern:
             continue
         pattern = pattern.replace(".", r"\.")
         pattern = pattern.replace("+", r"[0-9\.]+")
-        if re.match(f"^{pattern}$", current_ip):
-            return True
+        patterns.append(f"(?:{pattern})")
 
-    return False
+    if not patterns:
+        return None
+
+    return re.compile(f"^(?:{'|'.join(patterns)})$")
 
 
 def filter_words(request: Request, contents: str) -> str:
@@ -795,14 +850,20 @@ def read_version():
         return file.read().strip()
 
 
+@lru_cache(maxsize=1)
 def read_license():
     """루트 디렉토리의 LICENSE 텍스트 파일을 읽어서 라이센스 내용 반환
+    - 서버 실행 중에는 변경되지 않으므로 처음 한 번만 읽습니다.
+    - LICENSE 파일이 없으면 빈 문자열을 반환합니다.
 
     Returns:
         str: 라이센스 내용
     """
-    with open("LICENSE", "r", encoding="UTF-8") as file:
-        return file.read().strip()
+    try:
+        with open("LICENSE", "r", encoding="UTF-8") as file:
+            return file.read().strip()
+    except FileNotFoundError:
+        return ""
 
 
 def get_current_admin_menu_id(request: Request) -> Optional[str]:
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import re
 from contextlib import asynccontextmanager
@@ -6,24 +7,24 @@ from datetime import datetime, timedelta
 from dotenv import load_dotenv
 from fastapi import Depends, FastAPI, Path, Request, Response
 from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
-from sqlalchemy import delete, insert, select
+from sqlalchemy import delete, insert
 from sqlalchemy.exc import ProgrammingError
 from starlette.staticfiles import StaticFiles
 
-from core import models
-from core.database import DBConnect
+from core.database import db_connect
 from core.exception import AlertException, regist_core_exception_handler, template_response
 from core.middleware import regist_core_middleware, should_run_middleware
 from core.plugin import (
-    cache_plugin_menu, cache_plugin_state, get_plugin_state_change_time,
-    import_plugin_by_states, read_plugin_state, register_plugin,
-    register_plugin_admin_menu, register_statics,
+    cache_plugin_menu, cache_plugin_state, get_plugin_admin_menu,
+    get_plugin_state_change_time, import_plugin_by_states, read_plugin_state,
+    register_plugin, register_statics,
 )
 from core.routers import router as template_router
 from core.settings import ENV_PATH, settings
 from core.template import register_theme_statics
 from lib.common import (
-    get_client_ip, is_intercept_ip, is_possible_ip, session_member_key
+    get_cached_config, get_client_ip, is_intercept_ip, is_possible_ip,
+    session_member_key
 )
 from lib.dependency.dependencies import check_use_template
 from lib.member import is_super_admin
@@ -43,6 +44,9 @@ from api.v1.routers import router as api_router
 # This function is used to load key-value pairs from the file as environment variables.
 load_dotenv()
 
+# Characters not allowed in the auto-login member id cookie
+_CK_MB_ID_RE = re.compile(r"[^a-zA-Z0-9_]")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -51,6 +55,32 @@ async def lifespan(app: FastAPI):
     - Code before yield: executed when the server starts
     - Code after yield: executed when the server shuts down
     """
+    # Register routes and start the scheduler before the first request.
+    plugin_states = read_plugin_state()
+
+    def register_routes():
+        # Routes are matched in registration order, so everything that appends
+        # to app.router.routes runs sequentially in this one thread.
+        register_theme_statics(app)
+        # Register plugin routers first so they take precedence over core routers
+        import_plugin_by_states(plugin_states)
+        register_plugin(plugin_states)
+        register_statics(app, plugin_states)
+        for core_router in ROUTERS:
+            app.include_router(core_router)
+
+    # The scheduler does not touch the routes, so it starts concurrently.
+    await asyncio.gather(
+        asyncio.to_thread(register_routes),
+        asyncio.to_thread(scheduler.run_scheduler),
+    )
+
+    plugin_state_change_time = get_plugin_state_change_time()
+    cache_plugin_state.__setitem__('info', plugin_states)
+    cache_plugin_state.__setitem__('change_time', plugin_state_change_time)
+    cache_plugin_menu.__setitem__('admin_menus',
+                                  get_plugin_admin_menu(plugin_states, plugin_state_change_time))
+
     yield
     scheduler.remove_flag()
 
@@ -66,25 +96,13 @@ if not os.path.exists("data"):
     os.mkdir("data")
 
 # Register files in each path as static files.
-register_theme_statics(app)
+# Theme statics are registered in lifespan().
 app.mount("/static", StaticFiles(directory="static"), name="static")
 app.mount("/data", StaticFiles(directory="data"), name="data")
 
-# Register plugin routers first
-plugin_states = read_plugin_state()
-import_plugin_by_states(plugin_states)
-register_plugin(plugin_states)
-register_statics(app, plugin_states)
-
-cache_plugin_state.__setitem__('info', plugin_states)
-cache_plugin_state.__setitem__('change_time', get_plugin_state_change_time())
-cache_plugin_menu.__setitem__('admin_menus', register_plugin_admin_menu(plugin_states))
-
-app.include_router(admin_router)
-app.include_router(api_router)
-app.include_router(template_router)
-app.include_router(install_router)
-app.include_router(login_router)
+# Core routers, included in lifespan() after the plugin routers
+# (registration order is route matching order)
+ROUTERS = (admin_router, api_router, template_router, install_router, login_router)
 
 
 @app.middleware("http")
@@ -94,20 +112,22 @@ async def main_middleware(request: Request, call_next):
     if not await should_run_middleware(request):
         return await call_next(request)
 
+    # The installer does not use configuration or member information,
+    # so skip it before checking out a database connection.
+    url_path = request.url.path
+    if url_path.startswith("/install"):
+        return await call_next(request)
+
     # Check if database is installed
-    with DBConnect().sessionLocal() as db:
-        url_path = request.url.path
+    with db_connect.sessionLocal() as db:
         config = None
 
         try:
-            if not url_path.startswith("/install"):
-                # Disabled auto-redirect to installer when .env is missing
-                # if not os.path.exists(ENV_PATH):
-                #     raise AlertException(".env file not found. Please proceed with installation.", 400, "/install")
-                # Query basic configuration table
-                config = db.scalar(select(models.Config))
-            else:
-                return await call_next(request)
+            # Disabled auto-redirect to installer when .env is missing
+            # if not os.path.exists(ENV_PATH):
+            #     raise AlertException(".env file not found. Please proceed with installation.", 400, "/install")
+            # Query basic configuration table
+            config = get_cached_config(db)
 
         except AlertException as e:
             context = {"request": request, "errors": e.detail, "url": e.url}
@@ -127,7 +147,7 @@ async def main_middleware(request: Request, call_next):
 
         # Editor global variables
         request.state.editor = config.cf_editor
-        request.state.use_editor = True if config.cf_editor else False
+        request.state.use_editor = bool(config.cf_editor)
 
         # Cookie domain global variable
         request.state.cookie_domain = cookie_domain = settings.COOKIE_DOMAIN
@@ -139,48 +159,51 @@ async def main_middleware(request: Request, call_next):
         cookie_mb_id = request.cookies.get("ck_mb_id", "")
         current_ip = get_client_ip(request)
 
-        try:
-            member_service = MemberService(request, db)
-            # If login session is active
-            if session_mb_id:
-                member = member_service.get_member(session_mb_id)
-                # Clear session if member info doesn't exist or member is deactivated
-                if not member_service.is_activated(member)[0]:
-                    request.session.clear()
-                    member = None
-
-            # If auto-login cookie exists
-            elif cookie_mb_id:
-                mb_id = re.sub("[^a-zA-Z0-9_]", "", cookie_mb_id)[:20]
-                member = member_service.get_member(session_mb_id)
-
-                # Super admin does not use auto-login feature for security reasons.
-                if (not is_super_admin(request, mb_id)
-                        and member_service.is_member_email_certified(member)[0]
-                        and member_service.is_activated(member)[0]):
-                    # Check if the key stored in cookie matches the key generated by server
-                    ss_mb_key = session_member_key(request, member)
-                    if request.cookies.get("ck_auto") == ss_mb_key:
-                        request.session["ss_mb_id"] = cookie_mb_id
-                        is_autologin = True
-        except AlertException as e:
-            context = {"request": request, "errors": e.detail, "url": "/"}
-            response = template_response("alert.html", context, e.status_code)
-            response.delete_cookie("ck_auto")
-            response.delete_cookie("ck_mb_id")
-            request.session.clear()
-            return response
+        # Anonymous requests have no login session or auto-login cookie,
+        # so the member lookup is skipped entirely.
+        if session_mb_id or cookie_mb_id:
+            try:
+                member_service = MemberService(request, db)
+                # If login session is active
+                # - get_member() fetches the member with a single query and raises
+                #   if the member doesn't exist, is deactivated or is not email certified.
+                if session_mb_id:
+                    member = member_service.get_member(session_mb_id)
+
+                # If auto-login cookie exists
+                elif cookie_mb_id:
+                    mb_id = _CK_MB_ID_RE.sub("", cookie_mb_id)[:20]
+                    member = member_service.get_member(session_mb_id)
+
+                    # Super admin does not use auto-login feature for security reasons.
+                    if (not is_super_admin(request, mb_id)
+                            and member_service.is_member_email_certified(member)[0]
+                            and member_service.is_activated(member)[0]):
+                        # Check if the key stored in cookie matches the key generated by server
+                        ss_mb_key = session_member_key(request, member)
+                        if request.cookies.get("ck_auto") == ss_mb_key:
+                            request.session["ss_mb_id"] = cookie_mb_id
+                            is_autologin = True
+            except AlertException as e:
+                context = {"request": request, "errors": e.detail, "url": "/"}
+                response = template_response("alert.html", context, e.status_code)
+                response.delete_cookie("ck_auto")
+                response.delete_cookie("ck_mb_id")
+                request.session.clear()
+                return response
 
         if member:
             # If first login today, award points and update login information
-            ymd_str = datetime.now().strftime("%Y-%m-%d")
-            if member.mb_today_login.strftime("%Y-%m-%d") != ymd_str:
+            now = datetime.now()
+            today = now.date()
+            if member.mb_today_login.date() != today:
+                ymd_str = today.isoformat()
                 point_service = PointService(request, db, member_service)
                 point_service.save_point(
                     member.mb_id, config.cf_login_point, ymd_str + " First login",
                     "@login", member.mb_id, ymd_str)
 
-                member.mb_today_login = datetime.now()
+                member.mb_today_login = now
                 member.mb_login_ip = request.client.host
                 db.commit()
 
@@ -196,10 +219,13 @@ async def main_middleware(request: Request, call_next):
         if is_intercept_ip(request, current_ip):
             return HTMLResponse("<meta charset=utf-8>Access is blocked from this IP.")
 
-    # Set response object
-    response: Response = await call_next(request)
+        # Release the connection back to the pool while the route handler runs.
+        # The session itself is reused below for the visitor bookkeeping.
+        db.close()
+
+        # Set response object
+        response: Response = await call_next(request)
 
-    with DBConnect().sessionLocal() as db:
         age_1day = 60 * 60 * 24
 
         # Reset auto-login cookie
@@ -217,7 +243,7 @@ async def main_middleware(request: Request, call_next):
             visit_service = VisitService(request, db)
             visit_service.create_visit_record()
 
-    return response
+        return response
 
 # Function to add default middleware
 # This function must be located below the main_middleware function.
@@ -229,10 +255,6 @@ regist_core_middleware(app)
 regist_core_exception_handler(app)
 
 
-# Register and run scheduler
-scheduler.run_scheduler()
-
-
 @app.post("/generate_token",
           include_in_schema=False)
 async def generate_token(request: Request) -> JSONResponse: